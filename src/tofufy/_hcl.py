@@ -0,0 +1,114 @@
+"""Render Python values as HCL literals and attribute blocks.
+
+Kept free of closures and dynamic attribute access so the module can be
+compiled with Cython or mypyc without changes.
+"""
+
+import json
+import re
+from typing import Any, Dict, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+INDENT_STRINGS = tuple("  " * depth for depth in range(11))
+
+
+def dumps(value: Any) -> str:
+    # json escapes non-ASCII characters and DEL while orjson writes them verbatim,
+    # so orjson is only used where both produce the same output.
+    if _HAS_ORJSON and isinstance(value, str) and value.isascii() and "\x7f" not in value:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_hcl_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return dumps(value)
+
+
+_ATTRIBUTE_NAME_CACHE: Dict[str, str] = {}
+
+
+def format_attribute_name(name: str) -> str:
+    formatted = _ATTRIBUTE_NAME_CACHE.get(name)
+    if formatted is None:
+        if not name:
+            formatted = ""
+        elif IDENTIFIER_PATTERN.match(name):
+            formatted = name
+        else:
+            formatted = dumps(name)
+        _ATTRIBUTE_NAME_CACHE[name] = formatted
+    return formatted
+
+
+def render_attribute_block(attribute_name: str, attribute_value: Any, indent: int, out: TextIO) -> None:
+    indent_str = INDENT_STRINGS[indent] if indent < len(INDENT_STRINGS) else "  " * indent
+    write = out.write
+
+    if isinstance(attribute_value, dict):
+        if not attribute_value:
+            write(indent_str)
+            if attribute_name:
+                write(format_attribute_name(attribute_name))
+                write(" = {}\n")
+            else:
+                write("{},\n")
+            return
+        write(indent_str)
+        if attribute_name:
+            write(format_attribute_name(attribute_name))
+            write(" = {\n")
+        else:
+            write("{\n")
+        for key, value in attribute_value.items():
+            render_attribute_block(key, value, indent + 1, out)
+        write(indent_str)
+        write("}\n" if attribute_name else "},\n")
+    elif isinstance(attribute_value, list):
+        if not attribute_value:
+            write(indent_str)
+            if attribute_name:
+                write(format_attribute_name(attribute_name))
+                write(" = []\n")
+            else:
+                write("[]\n")
+            return
+        write(indent_str)
+        if attribute_name:
+            write(format_attribute_name(attribute_name))
+            write(" = [\n")
+        else:
+            write("[\n")
+        for item in attribute_value:
+            render_attribute_block("", item, indent + 1, out)
+        write(indent_str)
+        write("]\n" if attribute_name else "],\n")
+    else:
+        write(indent_str)
+        if attribute_name:
+            write(format_attribute_name(attribute_name))
+            write(" = ")
+            write(to_hcl_literal(attribute_value))
+            write("\n")
+        else:
+            write(to_hcl_literal(attribute_value))
+            write(",\n")
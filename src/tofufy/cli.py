@@ -2,21 +2,57 @@
 """Generate Terraform locals for Route53 record sets for each hosted zone."""
 
 import argparse
+import asyncio
+import contextlib
+import contextvars
+import dbm
+import functools
+import heapq
+import io
+import itertools
 import json
 import re
+import shelve
 import sys
-from collections import OrderedDict
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+try:  # Optional dependency for the --async backend.
+    import aioboto3
+except ImportError:  # pragma: no cover - exercised only when aioboto3 is absent.
+    aioboto3 = None
+
+from tofufy._hcl import dumps as _dumps, loads as _loads, render_attribute_block
+
 DEFAULT_CONFIG_PATH = "config-route53.json"
 
-SKIP_RECORD_TYPES = {"NS", "SOA"}
-SKIPPABLE_IMPORT_TYPES = {"A", "CNAME"}
-RECORD_SUFFIX_EXEMPT_TYPES = {"A", "CNAME"}
+SKIP_RECORD_TYPES = frozenset({"NS", "SOA"})
+SKIPPABLE_IMPORT_TYPES = frozenset({"A", "CNAME"})
+RECORD_SUFFIX_EXEMPT_TYPES = frozenset({"A", "CNAME"})
 
 DEFAULT_ARGUMENTS: Dict[str, Any] = {
     "zone_ids": [],
@@ -31,19 +67,61 @@ DEFAULT_ARGUMENTS: Dict[str, Any] = {
     "only_hostnames": [],
     "export_target": "both",
     "skip_zone_tags": False,
+    "cache_file": None,
+    "cache_ttl": 3600,
+    "no_cache": False,
 }
 
 EXPORT_TARGET_CHOICES = ("records", "zones", "both")
 
+# (skip, include) hostname patterns for the current export, set once by main().
+HOSTNAME_FILTERS: contextvars.ContextVar[
+    Tuple[Optional["HostnameMatcher"], Optional["HostnameMatcher"]]
+] = contextvars.ContextVar("hostname_filters", default=(None, None))
+# Default for collect_zone_records patterns: read HOSTNAME_FILTERS, while an explicit None means no filter.
+_FROM_CONTEXT: Any = object()
+
+MAX_ZONE_WORKERS = 16
+ZONE_SUBMIT_WINDOW = 2
+MAX_ASYNC_ZONE_TASKS = 32
+ROUTE53_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+ROUTE53_TAG_BATCH_SIZE = 10
+BULK_ZONE_LISTING_THRESHOLD = 20
+IMPORTS_WRITE_CHUNK_SIZE = 1 << 20
+
 PERCENT_ESCAPE_PATTERN = re.compile(r"%(?!%)")
-IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+SUBDOMAIN_CLEAN_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+IDENTIFIER_CLEAN_PATTERN = re.compile(r"[^A-Za-z0-9_]")
+# Zero-width boundaries so both word splits happen in a single substitution pass.
+SNAKE_CASE_PATTERN = re.compile(r"(?<=.)(?=[A-Z][a-z])|(?<=[a-z0-9])(?=[A-Z])")
+
+# Maps every ASCII character outside [A-Za-z0-9_] to "_"; non-ASCII input falls back to the regexes.
+IDENTIFIER_TRANSLATION = str.maketrans(
+    {chr(code): "_" for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")}
+)
 
 BEGIN_MARKER = "# BEGIN GENERATED ROUTE53 RECORDS"
 END_MARKER = "# END GENERATED ROUTE53 RECORDS"
 SINGLE_ZONE_BEGIN_MARKER = "# BEGIN GENERATED PRIMARY ZONE"
 SINGLE_ZONE_END_MARKER = "# END GENERATED PRIMARY ZONE"
 
+INLINE_FLAG_PATTERN = re.compile(r"\(\?[aiLmsux-]+[:)]")
+GENERATED_BLOCK_PATTERN = re.compile(
+    rf"{re.escape(BEGIN_MARKER)}.*?{re.escape(END_MARKER)}\n?", re.DOTALL
+)
+SINGLE_ZONE_BLOCK_PATTERN = re.compile(
+    rf"{re.escape(SINGLE_ZONE_BEGIN_MARKER)}.*?{re.escape(SINGLE_ZONE_END_MARKER)}\n?",
+    re.DOTALL,
+)
+
 
+@functools.lru_cache(maxsize=8)
 def build_session(profile: Optional[str]):
     session_kwargs = {}
     if profile:
@@ -51,6 +129,11 @@ def build_session(profile: Optional[str]):
     return boto3.Session(**session_kwargs)
 
 
+def invalidate_session_cache() -> None:
+    """Forget cached sessions, e.g. after credentials or profiles change."""
+    build_session.cache_clear()
+
+
 def normalize_config_key(value: Any) -> str:
     text = str(value or "").strip()
     if text.startswith("--"):
@@ -87,7 +170,7 @@ def load_config_file(path: Path, required: bool = False) -> Dict[str, Any]:
             raise FileNotFoundError(f"Config file not found: {path}")
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON in config file {path}: {exc}") from exc
     if not isinstance(data, dict):
@@ -95,16 +178,20 @@ def load_config_file(path: Path, required: bool = False) -> Dict[str, Any]:
     return data
 
 
-def apply_record_type_overrides(config_data: Dict[str, Any]) -> None:
-    global SKIP_RECORD_TYPES, SKIPPABLE_IMPORT_TYPES
+def resolve_record_type_overrides(
+    config_data: Dict[str, Any],
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    skip_record_types = SKIP_RECORD_TYPES
+    values = _coerce_string_list(config_data.get("skip_record_types"))
+    if values:
+        skip_record_types = frozenset(value.upper() for value in values)
 
-    skip_record_types = _coerce_string_list(config_data.get("skip_record_types"))
-    if skip_record_types:
-        SKIP_RECORD_TYPES = {value.upper() for value in skip_record_types}
+    skippable_import_types = SKIPPABLE_IMPORT_TYPES
+    values = _coerce_string_list(config_data.get("skippable_import_types"))
+    if values:
+        skippable_import_types = frozenset(value.upper() for value in values)
 
-    skippable_import_types = _coerce_string_list(config_data.get("skippable_import_types"))
-    if skippable_import_types:
-        SKIPPABLE_IMPORT_TYPES = {value.upper() for value in skippable_import_types}
+    return skip_record_types, skippable_import_types
 
 
 def normalize_config_data(config_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -152,6 +239,24 @@ def iter_record_sets(client, zone_id: str) -> Iterable[dict]:
 
 def get_zone_details(client, zone_id: str, include_tags: bool = True) -> Dict[str, Any]:
     response = client.get_hosted_zone(Id=zone_id)
+
+    tags: Dict[str, str] = {}
+    if include_tags:
+        try:
+            tag_response = client.list_tags_for_resource(
+                ResourceType="hostedzone", ResourceId=zone_id
+            )
+        except (ClientError, BotoCoreError):
+            tags = {}
+        else:
+            tags = _tags_to_dict(tag_response.get("ResourceTagSet", {}).get("Tags", []))
+
+    return zone_details_from_response(zone_id, response, tags)
+
+
+def zone_details_from_response(
+    zone_id: str, response: Dict[str, Any], tags: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
     hosted_zone = response.get("HostedZone", {})
     config = hosted_zone.get("Config") or {}
 
@@ -171,56 +276,221 @@ def get_zone_details(client, zone_id: str, include_tags: bool = True) -> Dict[st
             }
         )
 
-    tags: Dict[str, str] = {}
-    if include_tags:
-        try:
-            tag_response = client.list_tags_for_resource(
-                ResourceType="hostedzone", ResourceId=zone_id
-            )
-        except (ClientError, BotoCoreError):
-            tags = {}
-        else:
-            resource_tags = tag_response.get("ResourceTagSet", {}).get("Tags", [])
-            for entry in resource_tags:
-                key = entry.get("Key")
-                if key:
-                    tags[key] = entry.get("Value", "")
-
     return {
         "id": zone_id,
         "name": zone_name,
         "private_zone": private_zone,
         "comment": comment,
-        "tags": tags,
+        "tags": tags or {},
         "vpcs": vpcs,
     }
 
 
-def compute_relative_name(record_name: str, zone_name: str) -> str:
+def bulk_list_zones(client, zone_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Summarise the requested hosted zones from ListHostedZones, keyed by bare zone ID.
+
+    Paging stops as soon as every requested zone has been seen. ListHostedZones
+    does not return VPC associations, so private zones still need
+    get_zone_details when their VPCs are exported.
+    """
+    wanted = {zone_id.rsplit("/", 1)[-1] for zone_id in zone_ids}
+    zones: Dict[str, Dict[str, Any]] = {}
+    paginator = client.get_paginator("list_hosted_zones")
+    for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
+        for hosted_zone in page.get("HostedZones", []):
+            zone_id = (hosted_zone.get("Id") or "").rsplit("/", 1)[-1]
+            if zone_id not in wanted:
+                continue
+            config = hosted_zone.get("Config") or {}
+            zones[zone_id] = {
+                "id": zone_id,
+                "name": (hosted_zone.get("Name") or zone_id).rstrip("."),
+                "private_zone": bool(config.get("PrivateZone")),
+                "comment": config.get("Comment") or "",
+                "tags": {},
+                "vpcs": [],
+            }
+        if len(zones) == len(wanted):
+            break
+    return zones
+
+
+def _tags_to_dict(resource_tags: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    tags: Dict[str, str] = {}
+    for entry in resource_tags:
+        key = entry.get("Key")
+        if key:
+            tags[key] = entry.get("Value", "")
+    return tags
+
+
+def fetch_all_zone_tags(client, zone_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    zone_tags: Dict[str, Dict[str, str]] = {}
+    unique_ids = list(dict.fromkeys(zone_ids))
+    for start in range(0, len(unique_ids), ROUTE53_TAG_BATCH_SIZE):
+        chunk = unique_ids[start : start + ROUTE53_TAG_BATCH_SIZE]
+        # ListTagsForResources expects bare IDs and echoes them back without the /hostedzone/ prefix.
+        bare_ids = {zone_id.rsplit("/", 1)[-1]: zone_id for zone_id in chunk}
+        try:
+            response = client.list_tags_for_resources(
+                ResourceType="hostedzone", ResourceIds=list(bare_ids)
+            )
+        except (ClientError, BotoCoreError):
+            # One bad ID fails the whole batch, so retry the zones individually.
+            for zone_id in chunk:
+                try:
+                    tag_response = client.list_tags_for_resource(
+                        ResourceType="hostedzone", ResourceId=zone_id
+                    )
+                except (ClientError, BotoCoreError):
+                    continue
+                zone_tags[zone_id] = _tags_to_dict(
+                    tag_response.get("ResourceTagSet", {}).get("Tags", [])
+                )
+            continue
+        for tag_set in response.get("ResourceTagSets", []):
+            tagged_zone_id = bare_ids.get(tag_set.get("ResourceId") or "")
+            if tagged_zone_id is not None:
+                zone_tags[tagged_zone_id] = _tags_to_dict(tag_set.get("Tags", []))
+    return zone_tags
+
+
+class ZoneContext(NamedTuple):
+    zone_id: str
+    zone_name: str
+    zone_no_dot: str
+    zone_suffix: str
+
+
+class PatternSet(NamedTuple):
+    """Hostname patterns that cannot share one alternation, matched one by one."""
+
+    patterns: Tuple[Pattern[str], ...]
+
+    def search(self, value: str) -> bool:
+        return any(pattern.search(value) for pattern in self.patterns)
+
+
+HostnameMatcher = Union[Pattern[str], PatternSet]
+
+
+class OutputPaths(NamedTuple):
+    locals_file: Path
+    imports_file: Path
+    zones_file: Path
+    output_dir: Path
+    single_zone_records_file: Optional[Path]
+
+
+def build_output_paths(args: argparse.Namespace) -> OutputPaths:
+    return OutputPaths(
+        locals_file=Path(args.locals_file),
+        imports_file=Path(args.imports_file),
+        zones_file=Path(args.zones_file),
+        output_dir=Path(args.output_dir),
+        single_zone_records_file=(
+            Path(args.single_zone_records_file) if args.single_zone_records_file else None
+        ),
+    )
+
+
+def build_zone_context(zone_id: str, zone_name: str) -> ZoneContext:
+    zone_no_dot = (zone_name or "").rstrip(".")
+    # An empty zone yields "." which can never match a name that had its trailing dots stripped.
+    zone_suffix = f".{zone_no_dot}"
+    return ZoneContext(zone_id, zone_name, zone_no_dot, zone_suffix)
+
+
+class _ZoneDetailsCache:
+    """On-disk cache of untagged get_zone_details results, keyed by zone ID."""
+
+    def __init__(self, path: Path, ttl: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._shelf = shelve.open(str(path), flag="c")
+        self._ttl = ttl
+        # shelve is not thread-safe and zone workers share this cache.
+        self._lock = threading.Lock()
+
+    def get(self, zone_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._shelf.get(zone_id)
+        if entry is None:
+            return None
+        details, stored_at = entry
+        if time.time() - stored_at > self._ttl:
+            return None
+        return details
+
+    def put(self, zone_id: str, details: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._shelf[zone_id] = (details, time.time())
+        return details
+
+    def close(self) -> None:
+        with self._lock:
+            self._shelf.close()
+
+
+def open_zone_cache(args: argparse.Namespace) -> Optional[_ZoneDetailsCache]:
+    if getattr(args, "no_cache", False) or not getattr(args, "cache_file", None):
+        return None
+    path = Path(args.cache_file).expanduser()
+    try:
+        return _ZoneDetailsCache(path, args.cache_ttl)
+    except (OSError, *dbm.error) as exc:
+        print(f"Zone cache disabled, failed to open {path}: {exc}", file=sys.stderr)
+        return None
+
+
+def get_cached_zone_details(
+    client,
+    zone_id: str,
+    cache: Optional[_ZoneDetailsCache] = None,
+) -> Dict[str, Any]:
+    """Return zone details without tags, which are fetched separately in batches."""
+    if cache is not None:
+        details = cache.get(zone_id)
+        if details is not None:
+            return details
+    details = get_zone_details(client, zone_id, include_tags=False)
+    if cache is not None:
+        cache.put(zone_id, details)
+    return details
+
+
+def compute_relative_name(record_name: str, zone_suffix: str, zone_no_dot: str) -> str:
     name = (record_name or "").rstrip(".")
-    zone = (zone_name or "").rstrip(".")
 
-    if not name or name == zone:
+    if not name or name == zone_no_dot:
         return ""
 
-    if zone and name.endswith(f".{zone}"):
-        return name[: -(len(zone) + 1)]
+    if name.endswith(zone_suffix):
+        return name[: -len(zone_suffix)]
 
     return name
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_subdomain(value: str) -> str:
     if not value:
         return "root"
 
-    sanitized = value.replace("*", "star").replace("\\052", "star")
-    sanitized = re.sub(r"[^A-Za-z0-9]+", "_", sanitized.lower()).strip("_")
+    sanitized = value.replace("*", "star").replace("\\052", "star").lower()
+    if sanitized.isascii():
+        sanitized = sanitized.translate(IDENTIFIER_TRANSLATION)
+        while "__" in sanitized:
+            sanitized = sanitized.replace("__", "_")
+    else:
+        sanitized = SUBDOMAIN_CLEAN_PATTERN.sub("_", sanitized)
+    sanitized = sanitized.strip("_")
     return sanitized or "root"
 
 
 def escape_percent_signs(value: str) -> str:
     if not value or "%" not in value:
         return value
+    if "%%" not in value:
+        return value.replace("%", "%%")
     return PERCENT_ESCAPE_PATTERN.sub("%%", value)
 
 
@@ -232,14 +502,30 @@ def normalize_value(value: Any) -> Any:
     return value
 
 
+@functools.lru_cache(maxsize=256)
 def to_snake_case(value: str) -> str:
-    snake = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", value)
-    snake = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", snake)
-    return snake.lower()
+    return SNAKE_CASE_PATTERN.sub("_", value).lower()
+
+
+RECORD_ATTRIBUTE_KEYS = tuple(
+    (key_name, to_snake_case(key_name))
+    for key_name in (
+        "SetIdentifier",
+        "HealthCheckId",
+        "Failover",
+        "TrafficPolicyInstanceId",
+    )
+)
 
+GEO_LOCATION_ATTRIBUTE_KEYS = (
+    ("ContinentCode", "continent"),
+    ("CountryCode", "country"),
+    ("SubdivisionCode", "subdivision"),
+)
 
-def build_record_key(record_name: str, zone_name: str, record_type: str) -> Tuple[str, str, str]:
-    relative_name = compute_relative_name(record_name, zone_name)
+
+def build_record_key(record_name: str, ctx: ZoneContext, record_type: str) -> Tuple[str, str, str]:
+    relative_name = compute_relative_name(record_name, ctx.zone_suffix, ctx.zone_no_dot)
     subdomain = sanitize_subdomain(relative_name)
     record_key = subdomain
 
@@ -254,238 +540,140 @@ def build_record_key(record_name: str, zone_name: str, record_type: str) -> Tupl
     return record_key, relative_name, subdomain
 
 
-def normalize_record(record: dict, zone_name: str, zone_id: str) -> Optional[Dict[str, Any]]:
-    record_type = (record.get("Type") or "").upper()
-    if record_type in SKIP_RECORD_TYPES:
+def build_record_entry(
+    record: dict,
+    ctx: ZoneContext,
+    skip_patterns: Optional[HostnameMatcher] = None,
+    include_patterns: Optional[HostnameMatcher] = None,
+    skip_record_types: FrozenSet[str] = SKIP_RECORD_TYPES,
+    skippable_import_types: FrozenSet[str] = SKIPPABLE_IMPORT_TYPES,
+) -> Optional[Tuple[Tuple[str, str, str], str, Dict[str, Any]]]:
+    get = record.get
+    record_type = (get("Type") or "").upper()
+    if record_type in skip_record_types:
         return None
 
-    raw_name = (record.get("Name") or "").rstrip(".")
-    full_name = raw_name.replace("\\052", "*")
+    full_name = (get("Name") or "").rstrip(".").replace("\\052", "*")
+    if (
+        skip_patterns is not None
+        and record_type in skippable_import_types
+        and skip_patterns.search(full_name)
+    ):
+        return None
+    if include_patterns is not None and not include_patterns.search(full_name):
+        return None
 
-    key_base, relative_name, subdomain = build_record_key(full_name, zone_name, record_type)
+    key_base, _relative_name, _subdomain = build_record_key(full_name, ctx, record_type)
+    set_identifier = get("SetIdentifier")
 
-    normalized: Dict[str, Any] = {
-        "key_base": key_base,
-        "relative_name": relative_name,
-        "subdomain": subdomain,
+    attributes: Dict[str, Any] = {
         "full_name": full_name,
         "type": record_type,
     }
 
-    resource_records = record.get("ResourceRecords")
+    ttl = get("TTL")
+    if ttl is not None:
+        attributes["ttl"] = normalize_value(ttl)
+
+    resource_records = get("ResourceRecords")
     if resource_records:
+        unquote = record_type in {"TXT", "SPF"}
+        escape = escape_percent_signs
         values: List[str] = []
         for entry in resource_records:
             value = entry.get("Value", "")
-            if record_type in {"TXT", "SPF"} and value.startswith('"') and value.endswith('"'):
+            if unquote and value.startswith('"') and value.endswith('"'):
                 value = value[1:-1].replace('\\"', '"')
-            value = escape_percent_signs(value)
-            values.append(value)
-        normalized["records"] = values
+            values.append(escape(value))
+        attributes["records"] = values
 
-    alias_target = record.get("AliasTarget")
+    alias_target = get("AliasTarget")
     if alias_target:
-        alias_map: Dict[str, Any] = {
-            "name": (alias_target.get("DNSName") or "").rstrip(".").replace("\\052", "*"),
-            "zone_id": alias_target.get("HostedZoneId"),
-        }
+        alias_attributes: Dict[str, Any] = {}
+        alias_name = (alias_target.get("DNSName") or "").rstrip(".").replace("\\052", "*")
+        if alias_name:
+            alias_attributes["name"] = alias_name
+        if alias_target.get("HostedZoneId"):
+            alias_attributes["zone_id"] = alias_target.get("HostedZoneId")
         if alias_target.get("EvaluateTargetHealth") is not None:
-            alias_map["evaluate_target_health"] = alias_target.get("EvaluateTargetHealth")
-        normalized["alias"] = alias_map
-
-    geo_location = record.get("GeoLocation")
-    if geo_location:
-        normalized["geo_location"] = {
-            "continent_code": geo_location.get("ContinentCode"),
-            "country_code": geo_location.get("CountryCode"),
-            "subdivision_code": geo_location.get("SubdivisionCode"),
-        }
-
-    for key_name in (
-        "TTL",
-        "SetIdentifier",
-        "HealthCheckId",
-        "Failover",
-        "TrafficPolicyInstanceId",
-        "MultiValueAnswer",
-        "Region",
-        "Weight",
-    ):
-        value = record.get(key_name)
-        if value is not None:
-            normalized[to_snake_case(key_name)] = normalize_value(value)
-
-    record_name_for_id = normalized["full_name"] or zone_name
-    import_id_parts = [zone_id, record_name_for_id, record_type]
-    set_identifier = record.get("SetIdentifier")
-    if set_identifier:
-        import_id_parts.append(set_identifier)
-    normalized["import_id"] = "_".join(import_id_parts)
-
-    return normalized
-
-
-def build_record_attributes(record: Dict[str, Any]) -> "OrderedDict[str, Any]":
-    attributes: "OrderedDict[str, Any]" = OrderedDict()
-
-    attributes["full_name"] = record["full_name"]
-    attributes["type"] = record.get("type", "")
-
-    ttl = record.get("ttl")
-    if ttl is not None:
-        attributes["ttl"] = ttl
-
-    record_values = record.get("records", [])
-    if record_values:
-        attributes["records"] = record_values
-
-    alias = record.get("alias")
-    if alias:
-        alias_attributes: "OrderedDict[str, Any]" = OrderedDict()
-        if alias.get("name"):
-            alias_attributes["name"] = alias.get("name")
-        if alias.get("zone_id"):
-            alias_attributes["zone_id"] = alias.get("zone_id")
-        if alias.get("evaluate_target_health") is not None:
-            alias_attributes["evaluate_target_health"] = alias.get("evaluate_target_health")
+            alias_attributes["evaluate_target_health"] = alias_target.get("EvaluateTargetHealth")
         attributes["alias"] = alias_attributes
 
-    for key_name in ("set_identifier", "health_check_id", "failover", "traffic_policy_instance_id"):
-        if record.get(key_name) is not None:
-            attributes[key_name] = record.get(key_name)
-
-    if record.get("multi_value_answer") is not None:
-        attributes["multivalue_answer"] = record.get("multi_value_answer")
-
-    if record.get("region"):
-        attributes["latency_routing_policy"] = {"region": record.get("region")}
-
-    if record.get("weight") is not None:
-        attributes["weighted_routing_policy"] = {"weight": record.get("weight")}
-
-    geo_location = record.get("geo_location") or {}
-    geo_attributes: "OrderedDict[str, Any]" = OrderedDict()
-    mapping = {
-        "continent_code": "continent",
-        "country_code": "country",
-        "subdivision_code": "subdivision",
-    }
-    for original_key, target_key in mapping.items():
-        value = geo_location.get(original_key)
-        if value:
-            geo_attributes[target_key] = value
-    if geo_attributes:
-        attributes["geolocation_routing_policy"] = geo_attributes
-
-    return attributes
-
+    for key_name, attribute_name in RECORD_ATTRIBUTE_KEYS:
+        value = get(key_name)
+        if value is not None:
+            attributes[attribute_name] = normalize_value(value)
 
-def to_hcl_literal(value: Any) -> str:
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if value is None:
-        return "null"
-    if isinstance(value, (int, float)):
-        return str(value)
-    return json.dumps(value)
+    multi_value_answer = get("MultiValueAnswer")
+    if multi_value_answer is not None:
+        attributes["multivalue_answer"] = normalize_value(multi_value_answer)
 
+    region = get("Region")
+    if region:
+        attributes["latency_routing_policy"] = {"region": normalize_value(region)}
 
-def render_attribute_block(attribute_name: str, attribute_value: Any, indent: int, lines: List[str]) -> None:
-    indent_str = "  " * indent
+    weight = get("Weight")
+    if weight is not None:
+        attributes["weighted_routing_policy"] = {"weight": normalize_value(weight)}
 
-    def format_name(name: str) -> str:
-        if not name:
-            return ""
-        if IDENTIFIER_PATTERN.match(name):
-            return name
-        return json.dumps(name)
+    geo_location = get("GeoLocation")
+    if geo_location:
+        geo_attributes: Dict[str, Any] = {}
+        for original_key, target_key in GEO_LOCATION_ATTRIBUTE_KEYS:
+            value = geo_location.get(original_key)
+            if value:
+                geo_attributes[target_key] = value
+        if geo_attributes:
+            attributes["geolocation_routing_policy"] = geo_attributes
+
+    name_for_id = full_name or ctx.zone_name
+    import_id = "_".join(
+        (ctx.zone_id, name_for_id, record_type, set_identifier)
+        if set_identifier
+        else (ctx.zone_id, name_for_id, record_type)
+    )
 
-    if isinstance(attribute_value, dict):
-        if not attribute_value:
-            if attribute_name:
-                lines.append(f"{indent_str}{format_name(attribute_name)} = {{}}")
-            else:
-                lines.append(f"{indent_str}{{}},")
-            return
-        if attribute_name:
-            lines.append(f"{indent_str}{format_name(attribute_name)} = {{")
-        else:
-            lines.append(f"{indent_str}{{")
-        for key, value in attribute_value.items():
-            render_attribute_block(key, value, indent + 1, lines)
-        closing = "}" if attribute_name else "},"
-        lines.append(f"{indent_str}{closing}")
-    elif isinstance(attribute_value, list):
-        if not attribute_value:
-            if attribute_name:
-                lines.append(f"{indent_str}{format_name(attribute_name)} = []")
-            else:
-                lines.append(f"{indent_str}[]")
-            return
-        if attribute_name:
-            lines.append(f"{indent_str}{format_name(attribute_name)} = [")
-        else:
-            lines.append(f"{indent_str}[")
-        for item in attribute_value:
-            render_attribute_block("", item, indent + 1, lines)
-        closing = "]" if attribute_name else "],"
-        lines.append(f"{indent_str}{closing}")
-    else:
-        literal = to_hcl_literal(attribute_value)
-        if attribute_name:
-            lines.append(f"{indent_str}{format_name(attribute_name)} = {literal}")
-        else:
-            lines.append(f"{indent_str}{literal},")
+    return (key_base, set_identifier or "", full_name), import_id, attributes
 
 
 def render_zone_file(
     local_var: str,
     zone_key: str,
-    records: "OrderedDict[str, OrderedDict[str, Any]]",
+    records: Dict[str, Dict[str, Any]],
 ) -> str:
-    lines: List[str] = []
-    lines.append("locals {")
-    lines.append(f"  {local_var} = {{")
-    lines.append(f"    {json.dumps(zone_key)} = {{")
+    out = io.StringIO()
+    write = out.write
+    write(f"locals {{\n  {local_var} = {{\n    {_dumps(zone_key)} = {{\n")
     if records:
         for record_key, attributes in records.items():
-            lines.append(f"      {record_key} = {{")
-            attribute_lines: List[str] = []
+            write(f"      {record_key} = {{\n")
             for attr_name, attr_value in attributes.items():
-                render_attribute_block(attr_name, attr_value, 4, attribute_lines)
-            lines.extend(attribute_lines)
-            lines.append("      }")
-    lines.append("    }")
-    lines.append("  }")
-    lines.append("}")
-    lines.append("")
-    return "\n".join(lines)
+                render_attribute_block(attr_name, attr_value, 4, out)
+            write("      }\n")
+    write("    }\n  }\n}\n")
+    return out.getvalue()
 
 
 def render_single_zone_records(
     local_var: str,
-    records: "OrderedDict[str, OrderedDict[str, Any]]",
+    records: Dict[str, Dict[str, Any]],
 ) -> str:
-    lines: List[str] = []
-    lines.append("locals {")
-    lines.append(f"  {local_var} = {{")
+    out = io.StringIO()
+    write = out.write
+    write(f"locals {{\n  {local_var} = {{\n")
     if records:
         for record_key, attributes in records.items():
-            lines.append(f"    {record_key} = {{")
-            attribute_lines: List[str] = []
+            write(f"    {record_key} = {{\n")
             for attr_name, attr_value in attributes.items():
-                render_attribute_block(attr_name, attr_value, 3, attribute_lines)
-            lines.extend(attribute_lines)
-            lines.append("    }")
-    lines.append("  }")
-    lines.append("}")
-    lines.append("")
-    return "\n".join(lines)
+                render_attribute_block(attr_name, attr_value, 3, out)
+            write("    }\n")
+    write("  }\n}\n")
+    return out.getvalue()
 
 
 def to_ordered(value: Any) -> Any:
     if isinstance(value, dict):
-        ordered: "OrderedDict[str, Any]" = OrderedDict()
+        ordered: Dict[str, Any] = {}
         for key, entry in value.items():
             ordered[key] = to_ordered(entry)
         return ordered
@@ -494,18 +682,8 @@ def to_ordered(value: Any) -> Any:
     return value
 
 
-def ordered_to_builtin(value: Any) -> Any:
-    if isinstance(value, OrderedDict):
-        return {key: ordered_to_builtin(val) for key, val in value.items()}
-    if isinstance(value, dict):
-        return {key: ordered_to_builtin(val) for key, val in value.items()}
-    if isinstance(value, list):
-        return [ordered_to_builtin(item) for item in value]
-    return value
-
-
-def build_vpc_map(vpcs: List[Dict[str, Any]]) -> "OrderedDict[str, OrderedDict[str, Any]]":
-    vpc_map: "OrderedDict[str, OrderedDict[str, Any]]" = OrderedDict()
+def build_vpc_map(vpcs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    vpc_map: Dict[str, Dict[str, Any]] = {}
     sorted_vpcs = sorted(
         vpcs,
         key=lambda item: (item.get("vpc_region") or "", item.get("vpc_id") or ""),
@@ -517,7 +695,7 @@ def build_vpc_map(vpcs: List[Dict[str, Any]]) -> "OrderedDict[str, OrderedDict[s
         if not identifier:
             identifier = f"vpc_{index:02d}"
 
-        block: "OrderedDict[str, Any]" = OrderedDict()
+        block: Dict[str, Any] = {}
         if vpc.get("vpc_id"):
             block["vpc_id"] = vpc.get("vpc_id")
         if vpc.get("vpc_region"):
@@ -531,8 +709,9 @@ def build_vpc_map(vpcs: List[Dict[str, Any]]) -> "OrderedDict[str, OrderedDict[s
 def build_zone_configuration(
     zone_details: Dict[str, Any],
     include_tags: bool = True,
-) -> "OrderedDict[str, Any]":
-    attributes: "OrderedDict[str, Any]" = OrderedDict()
+    zone_tags: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {}
     attributes["name"] = zone_details.get("name")
     attributes["comment"] = zone_details.get("comment") or ""
     attributes["private_zone"] = bool(zone_details.get("private_zone"))
@@ -544,40 +723,38 @@ def build_zone_configuration(
 
     tags: Dict[str, str] = {}
     if include_tags:
-        tags = zone_details.get("tags") or {}
-    attributes["tags"] = OrderedDict(sorted((tags or {}).items()))
+        tags = zone_tags if zone_tags is not None else zone_details.get("tags") or {}
+    attributes["tags"] = dict(sorted((tags or {}).items()))
 
     return attributes
 
 
 def write_zones_file(
-    zones: "OrderedDict[str, OrderedDict[str, Any]]",
+    zones: Iterable[Tuple[str, Dict[str, Any]]],
     zones_path: Path,
     zone_records_var: str = "zone_records",
 ) -> None:
     zones_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: List[str] = []
-    lines.append("locals {")
-    lines.append("  zones = {")
-    if zones:
-        for zone_key, attributes in zones.items():
-            lines.append(f"    {json.dumps(zone_key)} = {{")
-            attribute_lines: List[str] = []
-            for attr_name, attr_value in attributes.items():
-                render_attribute_block(attr_name, attr_value, 3, attribute_lines)
-            lines.extend(attribute_lines)
-            lines.append("    }")
-    lines.append("  }")
-    lines.append("")
-    lines.append("}")
-    lines.append("")
+    out = io.StringIO()
+    write = out.write
+    write("locals {\n  zones = {\n")
+    for zone_key, attributes in zones:
+        write(f"    {_dumps(zone_key)} = {{\n")
+        for attr_name, attr_value in attributes.items():
+            render_attribute_block(attr_name, attr_value, 3, out)
+        write("    }\n")
+    write("  }\n\n}\n")
 
-    zones_path.write_text("\n".join(lines), encoding="utf-8")
+    zones_path.write_text(out.getvalue(), encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_identifier(value: str) -> str:
-    sanitized = re.sub(r"[^A-Za-z0-9_]", "_", value)
+    if value.isascii():
+        sanitized = value.translate(IDENTIFIER_TRANSLATION)
+    else:
+        sanitized = IDENTIFIER_CLEAN_PATTERN.sub("_", value)
     if not sanitized or sanitized[0].isdigit():
         sanitized = f"_{sanitized}"
     return sanitized
@@ -588,25 +765,35 @@ def collect_zone_records(
     zone_id: str,
     zone_name: str,
     private_zone: bool,
-    skip_patterns: Optional[List[Pattern[str]]] = None,
-    include_patterns: Optional[List[Pattern[str]]] = None,
-) -> Tuple[str, str, str, "OrderedDict[str, OrderedDict[str, Any]]", List[Tuple[str, str, str]]]:
-    records: List[Dict[str, Any]] = []
-    for item in iter_record_sets(client, zone_id):
-        normalized = normalize_record(item, zone_name, zone_id)
-        if normalized is None:
-            continue
-        hostname = normalized.get("full_name") or ""
-        if skip_patterns and normalized.get("type") in SKIPPABLE_IMPORT_TYPES:
-            for pattern in skip_patterns:
-                if pattern.search(hostname):
-                    normalized = None
-                    break
-            if normalized is None:
-                continue
-        if include_patterns and not any(pattern.search(hostname) for pattern in include_patterns):
-            continue
-        records.append(normalized)
+    skip_patterns: Optional[HostnameMatcher] = _FROM_CONTEXT,
+    include_patterns: Optional[HostnameMatcher] = _FROM_CONTEXT,
+    skip_record_types: FrozenSet[str] = SKIP_RECORD_TYPES,
+    skippable_import_types: FrozenSet[str] = SKIPPABLE_IMPORT_TYPES,
+    record_sets: Optional[Iterable[dict]] = None,
+) -> Tuple[str, str, str, Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]:
+    if skip_patterns is _FROM_CONTEXT or include_patterns is _FROM_CONTEXT:
+        context_skip, context_include = HOSTNAME_FILTERS.get()
+        if skip_patterns is _FROM_CONTEXT:
+            skip_patterns = context_skip
+        if include_patterns is _FROM_CONTEXT:
+            include_patterns = context_include
+    if record_sets is None:
+        record_sets = iter_record_sets(client, zone_id)
+    ctx = build_zone_context(zone_id, zone_name)
+    entries: List[Tuple[Tuple[str, str, str], str, Dict[str, Any]]] = []
+    build_entry = build_record_entry
+    append_entry = entries.append
+    for item in record_sets:
+        entry = build_entry(
+            item,
+            ctx,
+            skip_patterns,
+            include_patterns,
+            skip_record_types,
+            skippable_import_types,
+        )
+        if entry is not None:
+            append_entry(entry)
 
     zone_key = zone_name if not private_zone else f"{zone_name}_private"
     local_var = sanitize_identifier(f"zone_records_{zone_key}")
@@ -615,51 +802,219 @@ def collect_zone_records(
     if private_zone:
         filename_domain = f"{filename_domain}-private"
 
-    record_blocks: "OrderedDict[str, OrderedDict[str, Any]]" = OrderedDict()
-    counts: Dict[str, int] = {}
+    record_blocks: Dict[str, Dict[str, Any]] = {}
     import_entries: List[Tuple[str, str, str]] = []
-    for record in sorted(records, key=lambda item: (item["key_base"], item.get("set_identifier") or "", item["full_name"])):
-        base = record["key_base"]
-        counts[base] = counts.get(base, 0) + 1
-        suffix = "" if counts[base] == 1 else f"_{counts[base]:02d}"
-        record_key = f"{base}{suffix}"
-        record["key"] = record_key
-        record_blocks[record_key] = build_record_attributes(record)
-        import_entries.append((zone_key, record_key, record["import_id"]))
+    entries.sort(key=itemgetter(0))
+    base_counts = Counter(sort_key[0] for sort_key, _import_id, _attributes in entries)
+    seen: Dict[str, int] = {}
+    append_import = import_entries.append
+    for sort_key, import_id, attributes in entries:
+        base = sort_key[0]
+        if base_counts[base] == 1:
+            record_key = base
+        else:
+            index = seen.get(base, 0) + 1
+            seen[base] = index
+            record_key = base if index == 1 else f"{base}_{index:02d}"
+        record_blocks[record_key] = attributes
+        append_import((zone_key, record_key, import_id))
+    # Record keys are unique per zone, so this yields a sorted, duplicate-free run
+    # that callers can merge without a global set.
+    import_entries.sort()
 
     return zone_key, local_var, filename_domain, record_blocks, import_entries
 
 
-def export_records(
+def write_zone_records_file(
+    output_dir: Path,
+    filename_domain: str,
+    local_var: str,
+    zone_key: str,
+    record_blocks: Dict[str, Dict[str, Any]],
+) -> Path:
+    output_path = output_dir / f"route53-records-{filename_domain}.tf"
+    if output_path.exists():
+        output_path.unlink()
+
+    output_path.write_text(render_zone_file(local_var, zone_key, record_blocks), encoding="utf-8")
+    return output_path
+
+
+def _fetch_zone_data(
     client,
     zone_id: str,
-    zone_name: str,
-    private_zone: bool,
-    output_dir: Path,
-    skip_patterns: Optional[List[Pattern[str]]] = None,
-    include_patterns: Optional[List[Pattern[str]]] = None,
-) -> Tuple[str, str, Path, List[Tuple[str, str, str]]]:
-    output_dir.mkdir(parents=True, exist_ok=True)
+    collect_records: bool,
+    zone_cache: Optional[_ZoneDetailsCache] = None,
+    listed_details: Optional[Dict[str, Any]] = None,
+    require_vpcs: bool = False,
+    skip_record_types: FrozenSet[str] = SKIP_RECORD_TYPES,
+    skippable_import_types: FrozenSet[str] = SKIPPABLE_IMPORT_TYPES,
+) -> Tuple[
+    Dict[str, Any],
+    Optional[Tuple[str, str, str, Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]],
+]:
+    # ListHostedZones carries no VPC associations, so private zones need GetHostedZone.
+    if listed_details is not None and not (require_vpcs and listed_details["private_zone"]):
+        zone_details = dict(listed_details, id=zone_id)
+    else:
+        # Tags are fetched up front in batches by fetch_all_zone_tags.
+        zone_details = get_cached_zone_details(client, zone_id, cache=zone_cache)
+
+    collected = None
+    if collect_records:
+        collected = collect_zone_records(
+            client,
+            zone_id,
+            zone_details["name"],
+            bool(zone_details["private_zone"]),
+            skip_record_types=skip_record_types,
+            skippable_import_types=skippable_import_types,
+        )
+    return zone_details, collected
+
 
-    zone_key, local_var, filename_domain, record_blocks, import_entries = collect_zone_records(
-        client,
+async def _fetch_zone_data_async(
+    client,
+    semaphore: asyncio.Semaphore,
+    zone_id: str,
+    collect_records: bool,
+    zone_cache: Optional[_ZoneDetailsCache] = None,
+    listed_details: Optional[Dict[str, Any]] = None,
+    require_vpcs: bool = False,
+    skip_record_types: FrozenSet[str] = SKIP_RECORD_TYPES,
+    skippable_import_types: FrozenSet[str] = SKIPPABLE_IMPORT_TYPES,
+) -> Tuple[
+    Dict[str, Any],
+    Optional[Tuple[str, str, str, Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]],
+]:
+    """Async counterpart of _fetch_zone_data for an aioboto3 Route53 client."""
+    async with semaphore:
+        zone_details = None
+        # ListHostedZones carries no VPC associations, so private zones need GetHostedZone.
+        if listed_details is not None and not (require_vpcs and listed_details["private_zone"]):
+            zone_details = dict(listed_details, id=zone_id)
+        elif zone_cache is not None:
+            zone_details = zone_cache.get(zone_id)
+        if zone_details is None:
+            response = await client.get_hosted_zone(Id=zone_id)
+            zone_details = zone_details_from_response(zone_id, response)
+            if zone_cache is not None:
+                zone_cache.put(zone_id, zone_details)
+
+        if not collect_records:
+            return zone_details, None
+
+        record_sets: List[dict] = []
+        paginator = client.get_paginator("list_resource_record_sets")
+        async for page in paginator.paginate(HostedZoneId=zone_id):
+            record_sets.extend(page.get("ResourceRecordSets", []))
+
+    collected = collect_zone_records(
+        None,
         zone_id,
-        zone_name,
-        private_zone,
-        skip_patterns,
-        include_patterns,
+        zone_details["name"],
+        bool(zone_details["private_zone"]),
+        skip_record_types=skip_record_types,
+        skippable_import_types=skippable_import_types,
+        record_sets=record_sets,
     )
+    return zone_details, collected
+
+
+def iter_zone_data_threaded(
+    client, zone_ids: List[str], fetch_args: Callable[[str], tuple]
+) -> Generator[Tuple[str, Future], None, None]:
+    """Fetch zones on a thread pool and yield ``(zone_id, future)`` in zone order.
+
+    Only a window of zones is in flight; one more is submitted per result
+    consumed, so finished zones never pile up ahead of the writer.
+    ``fetch_args(zone_id)`` returns the remaining positional arguments for
+    _fetch_zone_data.
+    """
+    max_workers = min(MAX_ZONE_WORKERS, len(zone_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(zone_id: str) -> Future:
+            # Pool threads do not inherit context variables, so each task runs in a
+            # copy of this one to see HOSTNAME_FILTERS.
+            return executor.submit(
+                contextvars.copy_context().run,
+                _fetch_zone_data,
+                client,
+                zone_id,
+                *fetch_args(zone_id),
+            )
 
-    output_path = output_dir / f"route53-records-{filename_domain}.tf"
-    if output_path.exists():
-        output_path.unlink()
+        unsubmitted = iter(zone_ids)
+        pending: Deque[Tuple[str, Future]] = deque(
+            (zone_id, submit(zone_id))
+            for zone_id in itertools.islice(unsubmitted, ZONE_SUBMIT_WINDOW * max_workers)
+        )
+        while pending:
+            zone_id, future = pending.popleft()
+            next_zone_id = next(unsubmitted, None)
+            if next_zone_id is not None:
+                pending.append((next_zone_id, submit(next_zone_id)))
+            yield zone_id, future
+
+
+def iter_zone_data_async(
+    profile: Optional[str], zone_ids: List[str], fetch_args: Callable[[str], tuple]
+) -> Generator[Tuple[str, Future], None, None]:
+    """Fetch zones with aioboto3 and yield ``(zone_id, future)`` in zone order.
+
+    The event loop is driven one zone at a time: while the caller's next
+    zone is awaited, the rest of a bounded window of scheduled zones keeps
+    running, and the loop pauses while the caller writes each result.
+    ``fetch_args(zone_id)`` returns the remaining positional arguments for
+    _fetch_zone_data_async.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        session = aioboto3.Session(profile_name=profile) if profile else aioboto3.Session()
+        client_context = session.client("route53", config=ROUTE53_CLIENT_CONFIG)
+        client = loop.run_until_complete(client_context.__aenter__())
+        semaphore = asyncio.Semaphore(MAX_ASYNC_ZONE_TASKS)
+        pending: Deque[Tuple[str, asyncio.Task]] = deque()
+
+        def schedule(zone_id: str) -> None:
+            # Tasks copy the current context, so HOSTNAME_FILTERS is visible to them.
+            task = loop.create_task(
+                _fetch_zone_data_async(client, semaphore, zone_id, *fetch_args(zone_id))
+            )
+            pending.append((zone_id, task))
 
-    output_path.write_text(render_zone_file(local_var, zone_key, record_blocks), encoding="utf-8")
-    return zone_key, local_var, output_path, import_entries
+        try:
+            unsubmitted = iter(zone_ids)
+            for zone_id in itertools.islice(
+                unsubmitted, ZONE_SUBMIT_WINDOW * MAX_ASYNC_ZONE_TASKS
+            ):
+                schedule(zone_id)
+            while pending:
+                zone_id, task = pending.popleft()
+                next_zone_id = next(unsubmitted, None)
+                if next_zone_id is not None:
+                    schedule(next_zone_id)
+                future: Future = Future()
+                try:
+                    future.set_result(loop.run_until_complete(task))
+                except Exception as exc:
+                    future.set_exception(exc)
+                del task
+                yield zone_id, future
+        finally:
+            # Tasks are only left over when the caller stops early.
+            if pending:
+                for _zone_id, task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.wait([task for _zone_id, task in pending]))
+            loop.run_until_complete(client_context.__aexit__(None, None, None))
+    finally:
+        loop.close()
 
 
 def write_single_zone_records(
-    record_blocks: "OrderedDict[str, OrderedDict[str, Any]]",
+    record_blocks: Dict[str, Dict[str, Any]],
     records_path: Path,
     local_var: str = "zone_records",
 ) -> None:
@@ -671,53 +1026,49 @@ def write_single_zone_records(
 
 
 def write_imports_file(
-    import_entries: List[Tuple[str, str, str]],
+    import_entries: Iterable[Tuple[str, str, str]],
     imports_path: Path,
     single_zone: bool = False,
     zone_resource_id: Optional[str] = None,
-    zone_import_entries: Optional[List[Tuple[str, str]]] = None,
+    zone_import_entries: Optional[Iterable[Tuple[str, str]]] = None,
 ) -> None:
-    import_entries = sorted(import_entries, key=lambda item: (item[0], item[1]))
-    zone_import_entries = sorted(zone_import_entries or [], key=lambda item: item[0])
-
-    lines: List[str] = []
-    if zone_resource_id:
-        lines.extend(
-            [
-                "import {",
-                "  to = module.zone.aws_route53_zone.this[0]",
-                f"  id = {json.dumps(zone_resource_id)}",
-                "}",
-                "",
-            ]
-        )
-    for zone_key, zone_id in zone_import_entries:
-        lines.extend(
-            [
-                "import {",
-                f"  to = module.zones[{json.dumps(zone_key)}].aws_route53_zone.this[0]",
-                f"  id = {json.dumps(zone_id)}",
-                "}",
-                "",
-            ]
-        )
-    for zone_key, record_key, import_id in import_entries:
-        if single_zone:
-            to_line = f"  to = module.zone.aws_route53_record.this[{json.dumps(record_key)}]"
-        else:
-            to_line = (
-                f"  to = module.zones[{json.dumps(zone_key)}].aws_route53_record.this"
-                f"[{json.dumps(record_key)}]"
+    """Stream import blocks to ``imports_path``.
+
+    Entries must already be sorted. The file is opened with an
+    IMPORTS_WRITE_CHUNK_SIZE buffer, so blocks reach the kernel in a few large
+    writes without the whole file ever being held in memory.
+    """
+    with imports_path.open("w", encoding="utf-8", buffering=IMPORTS_WRITE_CHUNK_SIZE) as handle:
+        separator = ""
+        if zone_resource_id:
+            handle.write(
+                "import {\n"
+                "  to = module.zone.aws_route53_zone.this[0]\n"
+                f"  id = {_dumps(zone_resource_id)}\n"
+                "}\n"
             )
-        lines.extend([
-            "import {",
-            to_line,
-            f"  id = {json.dumps(import_id)}",
-            "}",
-            "",
-        ])
-    content = "\n".join(lines).rstrip() + ("\n" if lines else "")
-    imports_path.write_text(content, encoding="utf-8")
+            separator = "\n"
+        for zone_key, zone_id in zone_import_entries or ():
+            handle.write(
+                f"{separator}import {{\n"
+                f"  to = module.zones[{_dumps(zone_key)}].aws_route53_zone.this[0]\n"
+                f"  id = {_dumps(zone_id)}\n"
+                "}\n"
+            )
+            separator = "\n"
+        # Entries arrive grouped by zone, so the resource prefix is only rebuilt
+        # when the zone changes rather than re-quoting the zone key per record.
+        current_zone_key: Optional[str] = None
+        resource_prefix = "  to = module.zone.aws_route53_record.this"
+        for zone_key, record_key, import_id in import_entries:
+            if not single_zone and zone_key != current_zone_key:
+                current_zone_key = zone_key
+                resource_prefix = f"  to = module.zones[{_dumps(zone_key)}].aws_route53_record.this"
+            handle.write(
+                f"{separator}import {{\n{resource_prefix}[{_dumps(record_key)}]\n"
+                f"  id = {_dumps(import_id)}\n}}\n"
+            )
+            separator = "\n"
 
 
 def update_single_zone_locals(zone_name: str, locals_path: Path) -> None:
@@ -727,18 +1078,14 @@ def update_single_zone_locals(zone_name: str, locals_path: Path) -> None:
     else:
         original = ""
 
-    pattern = re.compile(
-        rf"{re.escape(SINGLE_ZONE_BEGIN_MARKER)}.*?{re.escape(SINGLE_ZONE_END_MARKER)}\n?",
-        re.DOTALL,
-    )
-    cleaned = re.sub(pattern, "", original).rstrip()
+    cleaned = SINGLE_ZONE_BLOCK_PATTERN.sub("", original).rstrip()
 
     zone_block = [
         SINGLE_ZONE_BEGIN_MARKER,
         "locals {",
         "  zone = {",
-        f"    name    = {json.dumps(zone_name)}",
-        f"    comment = {json.dumps(f'Primary {zone_name} zone')}",
+        f"    name    = {_dumps(zone_name)}",
+        f"    comment = {_dumps(f'Primary {zone_name} zone')}",
         "    tags    = {}",
         "  }",
         "}",
@@ -761,8 +1108,7 @@ def update_locals_file(local_vars: List[str], locals_path: Path) -> None:
     else:
         original = ""
 
-    pattern = re.compile(rf"{re.escape(BEGIN_MARKER)}.*?{re.escape(END_MARKER)}\n?", re.DOTALL)
-    cleaned = re.sub(pattern, "", original).rstrip()
+    cleaned = GENERATED_BLOCK_PATTERN.sub("", original).rstrip()
 
     block_lines: List[str] = [BEGIN_MARKER]
     if local_vars:
@@ -770,11 +1116,7 @@ def update_locals_file(local_vars: List[str], locals_path: Path) -> None:
             "locals {",
             "  zone_records = merge(",
             "    {},",
-        ])
-        for index, local_var in enumerate(local_vars):
-            suffix = "," if index < len(local_vars) - 1 else ""
-            block_lines.append(f"    local.{local_var}{suffix}")
-        block_lines.extend([
+            ",\n".join(f"    local.{local_var}" for local_var in local_vars),
             "  )",
             "}",
         ])
@@ -784,8 +1126,7 @@ def update_locals_file(local_vars: List[str], locals_path: Path) -> None:
             "  zone_records = {}",
             "}",
         ])
-    block_lines.append(END_MARKER)
-    block_lines.append("")
+    block_lines.extend((END_MARKER, ""))
 
     generated_block = "\n".join(block_lines)
     if cleaned:
@@ -818,24 +1159,43 @@ def parse_zone_ids_arg(raw: Optional[Union[str, Iterable[str]]]) -> List[str]:
     return zone_ids
 
 
-def parse_hostname_patterns(raw: Optional[Union[str, Iterable[str]]]) -> List[Pattern[str]]:
+def parse_hostname_patterns(
+    raw: Optional[Union[str, Iterable[str]]]
+) -> Optional[HostnameMatcher]:
     if not raw:
-        return []
+        return None
 
-    values: List[str]
+    values: Tuple[str, ...]
     if isinstance(raw, str):
-        values = [raw]
+        values = (raw,)
     else:
-        values = [str(item) for item in raw if item]
+        values = tuple(str(item) for item in raw if item)
 
-    patterns: List[Pattern[str]] = []
+    return _compile_hostname_patterns(values)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_hostname_patterns(values: Tuple[str, ...]) -> Optional[HostnameMatcher]:
+    expressions: List[str] = []
+    compiled: List[Pattern[str]] = []
     for raw_entry in values:
         for token in raw_entry.split(","):
             expression = token.strip()
             if not expression:
                 continue
-            patterns.append(re.compile(expression, re.IGNORECASE))
-    return patterns
+            # Compile each expression on its own first so errors point at the offending token.
+            compiled.append(re.compile(expression, re.IGNORECASE))
+            expressions.append(expression)
+
+    if not compiled:
+        return None
+    if len(compiled) == 1:
+        return compiled[0]
+    # Groups (numbered or named, and so backreferences) and inline flags change
+    # meaning or fail to compile once the tokens share one expression.
+    if any(pattern.groups or INLINE_FLAG_PATTERN.search(pattern.pattern) for pattern in compiled):
+        return PatternSet(tuple(compiled))
+    return re.compile("|".join(f"(?:{expression})" for expression in expressions), re.IGNORECASE)
 
 
 def get_zone_ids(args: argparse.Namespace) -> List[str]:
@@ -853,7 +1213,7 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 
     config_path = Path(DEFAULT_CONFIG_PATH)
     config_data = load_config_file(config_path, required=True)
-    apply_record_type_overrides(config_data)
+    skip_record_types, skippable_import_types = resolve_record_type_overrides(config_data)
     normalized_config = normalize_config_data(config_data)
 
     parser = argparse.ArgumentParser(
@@ -865,6 +1225,17 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
             "Comma-separated list of fully-qualified hostnames; only matching records will be exported."
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk cache of hosted zone details.",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Fetch zones concurrently on an asyncio event loop (requires aioboto3).",
+    )
     parser.add_argument(
         "--export-target",
         choices=EXPORT_TARGET_CHOICES,
@@ -875,10 +1246,22 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     args = parser.parse_args(argv_list)
 
     for key, value in normalized_config.items():
-        if key in ("only_hostnames", "export_target"):
+        if key in ("only_hostnames", "export_target", "no_cache"):
             continue
         setattr(args, key, value)
 
+    # cache_ttl only matters when a zone cache will actually be opened.
+    if args.cache_file and not args.no_cache:
+        raw_cache_ttl = args.cache_ttl
+        try:
+            args.cache_ttl = float(raw_cache_ttl)
+        except (TypeError, ValueError):
+            raise ValueError(f"cache_ttl must be a number of seconds, got {raw_cache_ttl!r}") from None
+        if args.cache_ttl < 0:
+            raise ValueError(f"cache_ttl must not be negative, got {raw_cache_ttl!r}")
+
+    args.skip_record_types = skip_record_types
+    args.skippable_import_types = skippable_import_types
     args._config_data = config_data
     args.config_file = str(config_path)
     return args
@@ -897,8 +1280,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"Failed to load zone IDs: {exc}", file=sys.stderr)
         return 1
 
-    skip_patterns = parse_hostname_patterns(getattr(args, "skip_hostnames", None))
-    include_patterns = parse_hostname_patterns(getattr(args, "only_hostnames", None))
+    # Compiled once here; every zone worker shares the same pattern objects.
+    try:
+        skip_patterns = parse_hostname_patterns(getattr(args, "skip_hostnames", None))
+        include_patterns = parse_hostname_patterns(getattr(args, "only_hostnames", None))
+    except re.error as exc:
+        print(f"Invalid hostname pattern {exc.pattern!r}: {exc}", file=sys.stderr)
+        return 1
 
     skip_zone_tags = bool(args.skip_zone_tags)
 
@@ -913,100 +1301,231 @@ def main(argv: Optional[List[str]] = None) -> int:
     if single_zone_mode and export_zones_enabled and not export_records_enabled:
         print("Zones-only export is not supported with --single-zone", file=sys.stderr)
         return 1
+    if args.use_async and aioboto3 is None:
+        print("--async requires the optional aioboto3 package", file=sys.stderr)
+        return 1
     zone_export_enabled = export_zones_enabled and not single_zone_mode
     include_zone_tags = zone_export_enabled and not skip_zone_tags
 
+    paths = build_output_paths(args)
+    if single_zone_mode and paths.single_zone_records_file is None:
+        print("--single-zone requires single_zone_records_file to be set", file=sys.stderr)
+        return 1
+    if export_records_enabled and not single_zone_mode:
+        try:
+            paths.output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            print(f"Failed to create output directory {args.output_dir}: {exc}", file=sys.stderr)
+            return 1
+
     try:
         session = build_session(args.profile)
-        client = session.client("route53")
+        # A single low-level client is thread-safe and is shared by every zone worker.
+        client = session.client("route53", config=ROUTE53_CLIENT_CONFIG)
     except (ClientError, BotoCoreError) as exc:
         print(f"Failed to create Route53 client: {exc}", file=sys.stderr)
         return 1
 
-    aggregate_imports: List[Tuple[str, str, str]] = []
-    aggregate_zone_imports: List[Tuple[str, str]] = []
+    # Probe credentials once so a bad profile fails here instead of in every zone worker.
+    try:
+        client.list_hosted_zones(MaxItems="1")
+    except (ClientError, BotoCoreError) as exc:
+        print(f"Failed to access Route53 with the configured credentials: {exc}", file=sys.stderr)
+        return 1
+
+    zone_cache = open_zone_cache(args)
+    filters_token = HOSTNAME_FILTERS.set((skip_patterns, include_patterns))
+    try:
+        if single_zone_mode:
+            # main() rejected a missing single_zone_records_file before building the client.
+            assert paths.single_zone_records_file is not None
+            return _run_single_zone(
+                args,
+                paths,
+                paths.single_zone_records_file,
+                client,
+                zone_ids[0],
+                zone_cache,
+                export_records_enabled=export_records_enabled,
+                export_zones_enabled=export_zones_enabled,
+            )
+        return _run_multi_zone(
+            args,
+            paths,
+            client,
+            zone_ids,
+            zone_cache,
+            export_records_enabled=export_records_enabled,
+            zone_export_enabled=zone_export_enabled,
+            include_zone_tags=include_zone_tags,
+        )
+    finally:
+        HOSTNAME_FILTERS.reset(filters_token)
+        if zone_cache is not None:
+            zone_cache.close()
+
+
+def _run_single_zone(
+    args: argparse.Namespace,
+    paths: OutputPaths,
+    records_path: Path,
+    client,
+    zone_id: str,
+    zone_cache: Optional[_ZoneDetailsCache],
+    *,
+    export_records_enabled: bool,
+    export_zones_enabled: bool,
+) -> int:
+    import_entries: List[Tuple[str, str, str]] = []
     zone_resource_import_id: Optional[str] = None
     successes = 0
 
-    if single_zone_mode:
-        records_path = Path(args.single_zone_records_file)
-        zone_id = zone_ids[0]
-        if export_records_enabled:
-            try:
-                zone_details = get_zone_details(client, zone_id, include_tags=include_zone_tags)
-                zone_name = zone_details["name"]
-                private_zone = bool(zone_details["private_zone"])
-                (
-                    _zone_key,
-                    _local_var,
-                    _filename,
-                    record_blocks,
-                    import_entries,
-                ) = collect_zone_records(
-                    client,
-                    zone_id,
-                    zone_name,
-                    private_zone,
-                    skip_patterns=skip_patterns,
-                    include_patterns=include_patterns,
-                )
-                write_single_zone_records(record_blocks, records_path)
-                update_single_zone_locals(zone_name, Path(args.locals_file))
-            except (ClientError, BotoCoreError) as exc:
-                print(f"Failed to export records for {zone_id}: {exc}", file=sys.stderr)
-            except OSError as exc:
-                print(f"Failed to write records for {zone_id}: {exc}", file=sys.stderr)
-            else:
-                aggregate_imports.extend(import_entries)
-                successes = 1
-                zone_resource_import_id = zone_id
-                print(f"Exported {zone_id} -> {records_path}")
-        if export_zones_enabled and not zone_export_enabled:
+    if export_records_enabled:
+        try:
+            zone_details = get_cached_zone_details(client, zone_id, cache=zone_cache)
+            zone_name = zone_details["name"]
+            private_zone = bool(zone_details["private_zone"])
+            (
+                _zone_key,
+                _local_var,
+                _filename,
+                record_blocks,
+                import_entries,
+            ) = collect_zone_records(
+                client,
+                zone_id,
+                zone_name,
+                private_zone,
+                skip_record_types=args.skip_record_types,
+                skippable_import_types=args.skippable_import_types,
+            )
+            write_single_zone_records(record_blocks, records_path)
+            update_single_zone_locals(zone_name, paths.locals_file)
+        except (ClientError, BotoCoreError) as exc:
+            print(f"Failed to export records for {zone_id}: {exc}", file=sys.stderr)
+        except OSError as exc:
+            print(f"Failed to write records for {zone_id}: {exc}", file=sys.stderr)
+        else:
+            successes = 1
+            zone_resource_import_id = zone_id
+            print(f"Exported {zone_id} -> {records_path}")
+    if export_zones_enabled:
+        print(
+            "Zone export is not supported in --single-zone mode; skipping zone output.",
+            file=sys.stderr,
+        )
+    if successes == 0:
+        print("No zones exported.", file=sys.stderr)
+        return 2
+
+    if not _write_imports(
+        args,
+        paths,
+        import_entries,
+        single_zone=True,
+        zone_resource_id=zone_resource_import_id,
+    ):
+        return 1
+    return _report_summary(
+        args,
+        successes,
+        1,
+        single_zone=True,
+        export_records_enabled=export_records_enabled,
+        zone_export_enabled=False,
+    )
+
+
+def _run_multi_zone(
+    args: argparse.Namespace,
+    paths: OutputPaths,
+    client,
+    zone_ids: List[str],
+    zone_cache: Optional[_ZoneDetailsCache],
+    *,
+    export_records_enabled: bool,
+    zone_export_enabled: bool,
+    include_zone_tags: bool,
+) -> int:
+    import_runs: List[List[Tuple[str, str, str]]] = []
+    aggregate_zone_imports: Set[Tuple[str, str]] = set()
+    aggregate_locals: Set[str] = set()
+    aggregate_zone_configs: Dict[str, Dict[str, Any]] = {}
+    successes = 0
+    total_zones = len(zone_ids)
+
+    output_dir = paths.output_dir
+
+    zone_tags: Dict[str, Dict[str, str]] = {}
+    if include_zone_tags:
+        zone_tags = fetch_all_zone_tags(client, zone_ids)
+
+    listed_zones: Dict[str, Dict[str, Any]] = {}
+    if total_zones >= BULK_ZONE_LISTING_THRESHOLD:
+        try:
+            listed_zones = bulk_list_zones(client, zone_ids)
+        except (ClientError, BotoCoreError) as exc:
             print(
-                "Zone export is not supported in --single-zone mode; skipping zone output.",
+                f"Failed to list hosted zones, fetching each zone instead: {exc}",
                 file=sys.stderr,
             )
+
+    def zone_fetch_args(zone_id: str) -> tuple:
+        return (
+            export_records_enabled,
+            zone_cache,
+            listed_zones.get(zone_id.rsplit("/", 1)[-1]),
+            zone_export_enabled,
+            args.skip_record_types,
+            args.skippable_import_types,
+        )
+
+    zone_results: Generator[Tuple[str, Future], None, None]
+    if args.use_async:
+        zone_results = iter_zone_data_async(args.profile, zone_ids, zone_fetch_args)
     else:
-        output_dir = Path(args.output_dir)
-        if export_records_enabled:
-            output_dir.mkdir(parents=True, exist_ok=True)
+        zone_results = iter_zone_data_threaded(client, zone_ids, zone_fetch_args)
 
-        aggregate_locals: List[str] = []
-        aggregate_zone_configs: Dict[str, "OrderedDict[str, Any]"] = {}
-        for zone_id in zone_ids:
+    # Results arrive in submission order so files and output stay deterministic. Each
+    # zone's record blocks are dropped once its file is written, so only the bounded
+    # window of in-flight zones stays in memory.
+    with contextlib.closing(zone_results):
+        for zone_id, future in zone_results:
             try:
-                zone_details = get_zone_details(client, zone_id, include_tags=include_zone_tags)
+                zone_details, collected = future.result()
                 zone_name = zone_details["name"]
                 private_zone = bool(zone_details["private_zone"])
                 zone_key = zone_name if not private_zone else f"{zone_name}_private"
 
                 per_zone_messages: List[str] = []
-                if export_records_enabled:
+                if collected is not None:
                     (
                         zone_key_from_records,
                         local_var,
-                        output_path,
+                        filename_domain,
+                        record_blocks,
                         import_entries,
-                    ) = export_records(
-                        client,
-                        zone_id,
-                        zone_name,
-                        private_zone,
+                    ) = collected
+                    output_path = write_zone_records_file(
                         output_dir,
-                        skip_patterns=skip_patterns,
-                        include_patterns=include_patterns,
+                        filename_domain,
+                        local_var,
+                        zone_key_from_records,
+                        record_blocks,
                     )
-                    aggregate_locals.append(local_var)
-                    aggregate_imports.extend(import_entries)
+                    del collected, record_blocks
+                    aggregate_locals.add(local_var)
+                    import_runs.append(import_entries)
                     per_zone_messages.append(f"records -> {output_path}")
                     # zone_key_from_records matches zone_key but keep source of truth from records
                     zone_key = zone_key_from_records
 
                 if zone_export_enabled:
-                    aggregate_zone_imports.append((zone_key, zone_id))
+                    aggregate_zone_imports.add((zone_key, zone_id))
                     aggregate_zone_configs[zone_key] = build_zone_configuration(
                         zone_details,
-                        include_tags=not skip_zone_tags,
+                        include_tags=include_zone_tags,
+                        zone_tags=zone_tags.get(zone_id),
                     )
                     per_zone_messages.append("zone config prepared")
 
@@ -1021,70 +1540,120 @@ def main(argv: Optional[List[str]] = None) -> int:
                     successes += 1
                     print(f"Exported {zone_id}: {', '.join(per_zone_messages)}")
 
-        if export_records_enabled:
-            aggregate_locals = sorted(set(aggregate_locals))
+    # Nothing succeeded: leave the existing locals, zones and imports files untouched.
+    if successes == 0:
+        print("No zones exported.", file=sys.stderr)
+        return 2
+
+    if export_records_enabled:
+        try:
+            update_locals_file(sorted(aggregate_locals), paths.locals_file)
+            print(f"Updated {args.locals_file} with generated zone record locals")
+        except OSError as exc:
+            print(f"Failed to update locals file {args.locals_file}: {exc}", file=sys.stderr)
+            return 1
+
+    if zone_export_enabled:
+        if aggregate_zone_configs:
+            # Zone keys are unique, so sorting the (key, config) pairs needs no
+            # second dict or per-key lookups.
+            ordered_zones = sorted(aggregate_zone_configs.items(), key=itemgetter(0))
             try:
-                update_locals_file(aggregate_locals, Path(args.locals_file))
-                print(f"Updated {args.locals_file} with generated zone record locals")
+                write_zones_file(ordered_zones, paths.zones_file)
+                print(f"Wrote zone configuration to {args.zones_file}")
             except OSError as exc:
-                print(f"Failed to update locals file {args.locals_file}: {exc}", file=sys.stderr)
+                print(f"Failed to write zones file {args.zones_file}: {exc}", file=sys.stderr)
                 return 1
+        else:
+            print(
+                "No zone configurations were generated; skipping zones file update.",
+                file=sys.stderr,
+            )
 
-        if zone_export_enabled:
-            aggregate_zone_imports = sorted(set(aggregate_zone_imports))
-            if aggregate_zone_configs:
-                ordered_zones: "OrderedDict[str, OrderedDict[str, Any]]" = OrderedDict(
-                    (key, aggregate_zone_configs[key]) for key in sorted(aggregate_zone_configs)
-                )
-                try:
-                    write_zones_file(ordered_zones, Path(args.zones_file))
-                    print(f"Wrote zone configuration to {args.zones_file}")
-                except OSError as exc:
-                    print(f"Failed to write zones file {args.zones_file}: {exc}", file=sys.stderr)
-                    return 1
-            else:
-                print(
-                    "No zone configurations were generated; skipping zones file update.",
-                    file=sys.stderr,
-                )
+    if not _write_imports(
+        args,
+        paths,
+        _merge_sorted_unique(import_runs),
+        single_zone=False,
+        zone_import_entries=sorted(aggregate_zone_imports),
+    ):
+        return 1
+    return _report_summary(
+        args,
+        successes,
+        total_zones,
+        single_zone=False,
+        export_records_enabled=export_records_enabled,
+        zone_export_enabled=zone_export_enabled,
+    )
 
-    aggregate_imports = sorted(set(aggregate_imports))
 
+def _merge_sorted_unique(runs: List[List[Tuple[str, str, str]]]) -> Iterable[Tuple[str, str, str]]:
+    # The same zone listed twice yields identical runs; drop the repeats while merging.
+    previous = None
+    for entry in heapq.merge(*runs):
+        if entry != previous:
+            previous = entry
+            yield entry
+
+
+def _write_imports(
+    args: argparse.Namespace,
+    paths: OutputPaths,
+    import_entries: Iterable[Tuple[str, str, str]],
+    *,
+    single_zone: bool,
+    zone_resource_id: Optional[str] = None,
+    zone_import_entries: Optional[Iterable[Tuple[str, str]]] = None,
+) -> bool:
     try:
         write_imports_file(
-            aggregate_imports,
-            Path(args.imports_file),
-            single_zone=single_zone_mode,
-            zone_resource_id=zone_resource_import_id,
-            zone_import_entries=aggregate_zone_imports,
+            import_entries,
+            paths.imports_file,
+            single_zone=single_zone,
+            zone_resource_id=zone_resource_id,
+            zone_import_entries=zone_import_entries,
         )
         print(f"Wrote import statements to {args.imports_file}")
     except OSError as exc:
         print(f"Failed to write imports file {args.imports_file}: {exc}", file=sys.stderr)
-        return 1
-
-    if successes != len(zone_ids):
+        return False
+    return True
+
+
+def _report_summary(
+    args: argparse.Namespace,
+    successes: int,
+    total_zones: int,
+    *,
+    single_zone: bool,
+    export_records_enabled: bool,
+    zone_export_enabled: bool,
+) -> int:
+    if successes != total_zones:
         print(
-            f"Completed with partial success: {successes}/{len(zone_ids)} zones exported.",
+            f"Completed with partial success: {successes}/{total_zones} zones exported.",
             file=sys.stderr,
         )
         return 2
+    if single_zone:
+        # The single-zone runner already printed "Exported <zone> -> <file>".
+        return 0
 
-    noun = "zone" if successes == 1 else "zones"
     summary_targets: List[str] = []
     destination_parts: List[str] = []
     if export_records_enabled:
         summary_targets.append("records")
-        record_destination = (
-            args.single_zone_records_file if single_zone_mode else args.output_dir
-        )
-        destination_parts.append(f"records -> {record_destination}")
+        destination_parts.append(f"records -> {args.output_dir}")
     if zone_export_enabled:
         summary_targets.append("zones")
         destination_parts.append(f"zones -> {args.zones_file}")
-    actions = " and ".join(summary_targets) if summary_targets else "data"
-    destination = "; ".join(destination_parts) if destination_parts else "requested outputs"
-    print(f"Exported {actions} for {successes} {noun} ({destination})")
+    if summary_targets:
+        noun = "zone" if successes == 1 else "zones"
+        print(
+            f"Exported {' and '.join(summary_targets)} for {successes} {noun} "
+            f"({'; '.join(destination_parts)})"
+        )
     return 0
 
 